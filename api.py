@@ -1,10 +1,23 @@
 # api.py - FastAPI REST API for Expense Tracker
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import HTMLResponse, StreamingResponse
+from pydantic import BaseModel, RootModel
+
+# Optional: serialize responses with orjson (C-based, much faster for large
+# list responses than the default json.dumps path)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    _dumps_bytes = orjson.dumps
+except ImportError:
+    import json
+    from fastapi.responses import JSONResponse as DefaultResponse
+    def _dumps_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+from typing import Dict, List, Optional
 from datetime import datetime
+import asyncio
 import csv
 
 # Import the Expense class from app.py
@@ -22,14 +35,18 @@ from app import (
     list_expenses,
     check_budgets,
     load_budgets,
-    save_budgets
+    save_budgets,
+    get_category_totals,
+    get_total_spent,
+    append_expense_to_csv
 )
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Expense Tracker API",
     description="REST API for managing personal expenses",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
 # Pydantic models for request/response validation
@@ -55,9 +72,36 @@ class ExpenseResponse(BaseModel):
     description: str
     tags: List[str]
 
+class BudgetsBody(RootModel[Dict[str, float]]):
+    """Typed category -> budget-amount map for the set-budgets endpoints."""
+
 # Global expenses list
 expenses = []
 
+# Deferred-save state: mutations mark the in-memory list dirty and a
+# background task flushes to disk, so API latency stays O(1) instead of
+# paying a full-file rewrite on every request
+_dirty = False
+FLUSH_INTERVAL_SECONDS = 5
+
+def _mark_dirty():
+    """Flag the expense list as needing a flush to disk."""
+    global _dirty
+    _dirty = True
+
+def _flush_if_dirty():
+    """Write the expense list to disk if there are unsaved changes."""
+    global _dirty
+    if _dirty:
+        save_expenses(list_expenses())
+        _dirty = False
+
+async def _flush_loop():
+    """Background task: periodically flush unsaved changes to disk."""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        _flush_if_dirty()
+
 # Load expenses on startup
 @app.on_event("startup")
 async def startup_event():
@@ -68,6 +112,22 @@ async def startup_event():
         print("No existing expenses found. Starting with empty list.")
     else:
         print(f"✅ Loaded {len(loaded)} expenses and set global variable")
+    # Schedule the periodic save-flush task, keeping a strong reference so
+    # the event loop (which only holds weak refs) can't garbage-collect it
+    app.state.flush_task = asyncio.create_task(_flush_loop())
+    # Cache the static dashboard page as pre-encoded bytes so serving it
+    # needs no file I/O or UTF-8 decode per request
+    try:
+        with open("templates/dashboard.html", "rb") as f:
+            app.state.dashboard_html = f.read()
+    except FileNotFoundError:
+        app.state.dashboard_html = None
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the flush task and write any unsaved changes before the API stops."""
+    app.state.flush_task.cancel()
+    _flush_if_dirty()
 
 # Root endpoint
 @app.get("/")
@@ -93,26 +153,32 @@ async def root():
 # Dashboard HTML page
 @app.get("/dashboard", response_class=HTMLResponse)
 async def serve_dashboard():
-    """Serve the HTML dashboard."""
-    with open("templates/dashboard.html", "r", encoding="utf-8") as f:
-        html_content = f.read()
-    return HTMLResponse(content=html_content)
+    """Serve the HTML dashboard (cached at startup)."""
+    html_bytes = getattr(app.state, "dashboard_html", None)
+    if html_bytes is None:
+        # Fall back to disk if the page wasn't there at startup
+        with open("templates/dashboard.html", "rb") as f:
+            html_bytes = f.read()
+    return HTMLResponse(content=html_bytes)
 
 # GET all expenses
-@app.get("/expenses", response_model=List[ExpenseResponse])
+@app.get("/expenses")
 async def get_all_expenses():
-    """Retrieve all expenses."""
-    return [
-        ExpenseResponse(
-            id=e.id,
-            amount=e.amount,
-            category=e.category,
-            date=e.date.strftime('%Y-%m-%d'),
-            description=e.description,
-            tags=e.tags
-        )
-        for e in list_expenses()
-    ]
+    """Retrieve all expenses, streamed as a JSON array."""
+    def generate():
+        # Emit one serialized expense at a time so peak memory stays O(1)
+        # and the first bytes go out before the full list is encoded
+        yield b'['
+        first = True
+        for e in list_expenses():
+            if first:
+                first = False
+            else:
+                yield b','
+            yield _dumps_bytes(e.to_response_dict())
+        yield b']'
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 # GET expense by ID
 @app.get("/expenses/{expense_id}", response_model=ExpenseResponse)
@@ -121,15 +187,8 @@ async def get_expense_by_id(expense_id: int):
     expense = get_expense(expense_id)
     if not expense:
         raise HTTPException(status_code=404, detail=f"Expense with ID {expense_id} not found")
-    
-    return ExpenseResponse(
-        id=expense.id,
-        amount=expense.amount,
-        category=expense.category,
-        date=expense.date.strftime('%Y-%m-%d'),
-        description=expense.description,
-        tags=expense.tags
-    )
+
+    return ExpenseResponse.model_construct(**expense.to_response_dict())
 
 # POST create new expense
 @app.post("/expenses", response_model=ExpenseResponse, status_code=201)
@@ -146,17 +205,12 @@ async def create_new_expense(expense_data: ExpenseCreate):
     if not new_expense:
         raise HTTPException(status_code=400, detail="Failed to create expense. Check date format (YYYY-MM-DD).")
     
-    # Auto-save after creating
-    save_expenses(list_expenses())
-    
-    return ExpenseResponse(
-        id=new_expense.id,
-        amount=new_expense.amount,
-        category=new_expense.category,
-        date=new_expense.date.strftime('%Y-%m-%d'),
-        description=new_expense.description,
-        tags=new_expense.tags
-    )
+    # Persist the new row with a single O(1) append; fall back to a
+    # deferred full save when the store doesn't support appends
+    if not append_expense_to_csv(new_expense):
+        _mark_dirty()
+
+    return ExpenseResponse.model_construct(**new_expense.to_response_dict())
 
 # PUT update expense
 @app.put("/expenses/{expense_id}", response_model=ExpenseResponse)
@@ -174,19 +228,12 @@ async def update_existing_expense(expense_id: int, expense_data: ExpenseUpdate):
     if not success:
         raise HTTPException(status_code=404, detail=f"Expense with ID {expense_id} not found or update failed")
     
-    # Auto-save after updating
-    save_expenses(list_expenses())
+    # Defer the save; the background task flushes shortly
+    _mark_dirty()
     
     # Return updated expense
     updated_expense = get_expense(expense_id)
-    return ExpenseResponse(
-        id=updated_expense.id,
-        amount=updated_expense.amount,
-        category=updated_expense.category,
-        date=updated_expense.date.strftime('%Y-%m-%d'),
-        description=updated_expense.description,
-        tags=updated_expense.tags
-    )
+    return ExpenseResponse.model_construct(**updated_expense.to_response_dict())
 
 # DELETE expense
 @app.delete("/expenses/{expense_id}")
@@ -197,8 +244,8 @@ async def delete_existing_expense(expense_id: int):
     if not success:
         raise HTTPException(status_code=404, detail=f"Expense with ID {expense_id} not found")
     
-    # Auto-save after deleting
-    save_expenses(list_expenses())
+    # Defer the save; the background task flushes shortly
+    _mark_dirty()
     
     return {"message": f"Expense {expense_id} deleted successfully"}
 
@@ -207,36 +254,23 @@ async def delete_existing_expense(expense_id: int):
 async def filter_expenses_endpoint(category: Optional[str] = None, tag: Optional[str] = None):
     """Filter expenses by category and/or tag."""
     filtered = filter_expenses(category=category, tag=tag)
-    
-    return [
-        ExpenseResponse(
-            id=e.id,
-            amount=e.amount,
-            category=e.category,
-            date=e.date.strftime('%Y-%m-%d'),
-            description=e.description,
-            tags=e.tags
-        )
-        for e in filtered
-    ]
+
+    return [ExpenseResponse.model_construct(**e.to_response_dict()) for e in filtered]
 
 # GET spending summary
 @app.get("/expenses/summary/category")
 async def get_spending_summary():
     """Get total spending by category."""
-    import pandas as pd
-    
-    if not expenses:
+    all_expenses = list_expenses()
+    if not all_expenses:
         return {"summary": {}, "total": 0.0}
-    
-    df = pd.DataFrame([e.to_dict() for e in expenses])
-    category_summary = df.groupby('category')['amount'].sum().to_dict()
-    total = df['amount'].sum()
-    
+
+    # Read the running totals maintained on every create/update/delete
+    # instead of rebuilding a DataFrame and re-aggregating per request
     return {
-        "summary": category_summary,
-        "total": float(total),
-        "expense_count": len(expenses)
+        "summary": dict(get_category_totals()),
+        "total": float(get_total_spent()),
+        "expense_count": len(all_expenses)
     }
 
 # GET budget status
@@ -256,8 +290,9 @@ async def get_budgets():
 # POST/PUT to set budgets
 @app.post("/budgets/set")
 @app.put("/budgets/set")
-async def set_budgets(budgets: dict):
+async def set_budgets(body: BudgetsBody):
     """Set budget amounts for categories. Example: {"Food": 150.00, "Transport": 300.00}"""
+    budgets = body.root
     save_budgets(budgets)
     return {"message": "Budgets updated successfully", "budgets": budgets}
 
@@ -265,28 +300,11 @@ async def set_budgets(budgets: dict):
 @app.get("/dashboard/data")
 async def get_dashboard_data():
     """Get comprehensive dashboard data including spending summary and budget status."""
-    # Get spending summary
-    summary_data = {}
-    total_spent = 0.0
-    
+    # Read the running totals maintained on every create/update/delete
     expenses = list_expenses()  # Get expenses from app.py
-    
-    if expenses:
-        try:
-            import pandas as pd
-            df = pd.DataFrame([e.to_dict() for e in expenses])
-            category_summary = df.groupby('category')['amount'].sum().to_dict()
-            total_spent = df['amount'].sum()
-            summary_data = category_summary
-        except ImportError:
-            # Manual calculation if pandas not available
-            for e in expenses:
-                if e.category in summary_data:
-                    summary_data[e.category] += e.amount
-                else:
-                    summary_data[e.category] = e.amount
-            total_spent = sum(e.amount for e in expenses)
-    
+    summary_data = dict(get_category_totals())
+    total_spent = get_total_spent()
+
     # Get budget status
     budget_data = check_budgets()
     
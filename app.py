@@ -3,23 +3,59 @@
 # Define a class for an expense with amount, category, date, description, and tags.
 # It should also have an auto-incrementing id.
 
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Optional
 import csv
 import json
+import os
 
-# Optional imports for charting
+# Optional import for fast CSV parsing (also required for charting)
 try:
     import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Optional import for charting; needs matplotlib on top of pandas
+try:
     import matplotlib.pyplot as plt
-    CHARTS_AVAILABLE = True
+    CHARTS_AVAILABLE = PANDAS_AVAILABLE
 except ImportError:
     CHARTS_AVAILABLE = False
+
+if not CHARTS_AVAILABLE:
     print("⚠️ Charts unavailable: pandas/matplotlib not installed")
 
+# Optional imports for fast array-based aggregation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional import for columnar (Feather) storage
+try:
+    import pyarrow as pa
+    import pyarrow.feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
 class Expense:
     """Class to represent an expense with auto-incrementing ID."""
-    
+
+    # Fixed slots instead of a per-instance __dict__: smaller objects and
+    # faster attribute access in the hot aggregation/serialization loops
+    __slots__ = ('id', 'amount', 'category', 'date', 'description', 'tags',
+                 '_date_str', '_category_lower')
+
     _next_id = 1  # Class variable for auto-incrementing ID
     
     def __init__(self, amount: float, category: str, date: datetime, description: str, tags: List[str] = None):
@@ -41,10 +77,14 @@ class Expense:
         self.date = date
         self.description = description
         self.tags = tags or []
-    
+        # Cache the formatted date so API responses don't re-run strftime
+        self._date_str = date.strftime('%Y-%m-%d')
+        # Cache the lowercased category so filtering is a plain comparison
+        self._category_lower = category.lower()
+
     def __str__(self):
         """String representation of the expense."""
-        return f"Expense(id={self.id}, amount=${self.amount:.2f}, category='{self.category}', date={self.date.strftime('%Y-%m-%d')}, description='{self.description}', tags={self.tags})"
+        return f"Expense(id={self.id}, amount=${self.amount:.2f}, category='{self.category}', date={self._date_str}, description='{self.description}', tags={self.tags})"
     
     def __repr__(self):
         """Detailed representation of the expense."""
@@ -61,24 +101,164 @@ class Expense:
             'tags': self.tags
         }
 
+    def to_response_dict(self):
+        """Convert expense to a plain dict shaped like the API response."""
+        return {
+            'id': self.id,
+            'amount': self.amount,
+            'category': self.category,
+            'date': self._date_str,
+            'description': self.description,
+            'tags': self.tags
+        }
+
 # Define the data file names
 DATA_FILE = "expenses.csv"
+FEATHER_FILE = "expenses.feather"
 BUDGETS_FILE = "budgets.json"
 
 # Global expenses list
 expenses = []
 
+# ID -> Expense index kept in sync with the expenses list for O(1) lookups
+_by_id = {}
+
+# Running category -> total and overall total, updated incrementally on every
+# create/update/delete so summary endpoints never have to re-aggregate the list
+_category_totals = {}
+_total_spent = 0.0
+
+# Inverted index: lowercased tag -> set of expense IDs carrying it
+_tag_index = {}
+
+def _index_tags(expense: Expense):
+    """Add an expense's tags to the inverted tag index."""
+    for t in expense.tags:
+        _tag_index.setdefault(t.lower(), set()).add(expense.id)
+
+def _unindex_tags(expense: Expense):
+    """Remove an expense's tags from the inverted tag index."""
+    for t in expense.tags:
+        ids = _tag_index.get(t.lower())
+        if ids is not None:
+            ids.discard(expense.id)
+            if not ids:
+                del _tag_index[t.lower()]
+
 def set_expenses(expense_list: List[Expense]):
     """Set the global expenses list."""
-    global expenses
+    global expenses, _by_id, _category_totals, _total_spent, _tag_index
     expenses = expense_list
+    # Rebuild the ID index to match the new list
+    _by_id = {e.id: e for e in expense_list}
+    # Rebuild the inverted tag index
+    _tag_index = {}
+    for e in expense_list:
+        _index_tags(e)
+    # Rebuild the running totals from scratch (defaultdict: one dict probe
+    # per row instead of a membership test plus a lookup)
+    totals = defaultdict(float)
+    total = 0.0
+    for e in expense_list:
+        totals[e.category] += e.amount
+        total += e.amount
+    # Drop zero-net categories, matching the incremental path in
+    # _add_to_totals so summaries look the same before and after a restart
+    _category_totals = {category: t for category, t in totals.items() if t}
+    _total_spent = total
+    _mark_soa_dirty()
+
+def get_category_totals() -> dict:
+    """Return the running category -> total spending dict."""
+    return _category_totals
+
+def get_total_spent() -> float:
+    """Return the running total spent across all expenses."""
+    return _total_spent
+
+# Structure-of-Arrays mirror of the expense columns the analytics paths
+# actually read. The Expense list stays the canonical store for CRUD and the
+# API; filters, summaries, and budget checks run over these flat arrays so
+# hot loops touch contiguous typed data instead of dereferencing attributes
+# per object. Rebuilt lazily on first use after any create/update/delete.
+_soa_dirty = True
+_soa_amounts = None   # np.ndarray[float64] of amounts
+_soa_cat_codes = None # np.ndarray[int32] of category codes
+_soa_cat_list = []    # code -> category name
+_soa_cat_lower = None # np.ndarray[object] of lowercased categories
+
+def _mark_soa_dirty():
+    """Flag the SoA cache for rebuild after a mutation."""
+    global _soa_dirty
+    _soa_dirty = True
+
+def _refresh_soa():
+    """Rebuild the SoA arrays from the expenses list if stale (requires NumPy)."""
+    global _soa_dirty, _soa_amounts, _soa_cat_codes, _soa_cat_list, _soa_cat_lower
+    if _soa_dirty:
+        cat_to_code = {}
+        codes = []
+        for e in expenses:
+            code = cat_to_code.setdefault(e.category, len(cat_to_code))
+            codes.append(code)
+        _soa_amounts = np.array([e.amount for e in expenses], dtype=np.float64)
+        _soa_cat_codes = np.array(codes, dtype=np.int32)
+        _soa_cat_list = list(cat_to_code)
+        _soa_cat_lower = np.array([e._category_lower for e in expenses], dtype=object)
+        _soa_dirty = False
+    return _soa_amounts, _soa_cat_codes, _soa_cat_list
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _sum_by_cat(amounts, codes, ncat):
+        """Sum amounts into per-category totals (compiled, explicit index loop)."""
+        out = np.zeros(ncat)
+        for i in range(amounts.shape[0]):
+            out[codes[i]] += amounts[i]
+        return out
+
+def spending_by_category() -> dict:
+    """Return total spending per category as a single vectorized reduction."""
+    if NUMPY_AVAILABLE and expenses:
+        amounts, cat_codes, cat_list = _refresh_soa()
+        if NUMBA_AVAILABLE:
+            totals = _sum_by_cat(amounts, cat_codes, len(cat_list))
+        else:
+            # One C-loop FP reduction over the whole column
+            totals = np.bincount(cat_codes, weights=amounts, minlength=len(cat_list))
+        # Drop zero-net categories to match the running-totals behavior
+        return {category: t for category, t in zip(cat_list, totals.tolist()) if t}
+    # Without NumPy the running totals are already the answer
+    return dict(_category_totals)
+
+def _add_to_totals(category: str, amount: float):
+    """Apply a (possibly negative) amount delta to the running totals."""
+    global _total_spent
+    new_total = _category_totals.get(category, 0.0) + amount
+    if new_total:
+        _category_totals[category] = new_total
+    else:
+        # Drop emptied categories so summaries don't report 0.0 entries
+        _category_totals.pop(category, None)
+    _total_spent += amount
 
 # Budget management functions
+
+# Parsed budgets cache, re-read only when the file's mtime changes
+_budgets_cache = None
+_budgets_mtime = 0
+
 def load_budgets() -> dict:
-    """Load budgets from JSON file."""
+    """Load budgets from JSON file (cached until the file changes on disk)."""
+    global _budgets_cache, _budgets_mtime
     try:
+        mtime = os.path.getmtime(BUDGETS_FILE)
+        if _budgets_cache is not None and mtime == _budgets_mtime:
+            return _budgets_cache
         with open(BUDGETS_FILE, 'r', encoding='utf-8') as file:
             budgets = json.load(file)
+        _budgets_cache = budgets
+        _budgets_mtime = mtime
         print(f"✅ Loaded budgets from {BUDGETS_FILE}")
         return budgets
     except FileNotFoundError:
@@ -99,9 +279,13 @@ def load_budgets() -> dict:
 
 def save_budgets(budgets: dict):
     """Save budgets to JSON file."""
+    global _budgets_cache, _budgets_mtime
     try:
         with open(BUDGETS_FILE, 'w', encoding='utf-8') as file:
             json.dump(budgets, file, indent=2)
+        # Refresh the cache so the next load_budgets skips the re-read
+        _budgets_cache = budgets
+        _budgets_mtime = os.path.getmtime(BUDGETS_FILE)
         print(f"✅ Saved budgets to {BUDGETS_FILE}")
     except Exception as e:
         print(f"❌ Error saving budgets: {e}")
@@ -109,42 +293,147 @@ def save_budgets(budgets: dict):
 # Add functions to save the expenses list to a CSV file and load them on startup.
 # The load function must handle recreating Expense objects from the saved dictionary data.
 def save_expenses(expense_list: List[Expense]):
-    """Save expenses to a CSV file."""
+    """Save expenses to disk (columnar Feather if pyarrow is installed, else CSV)."""
+    if ARROW_AVAILABLE:
+        try:
+            # Columnar, typed storage: no string dates or pipe-joined tags to
+            # re-parse at startup, and much smaller on disk than CSV
+            table = pa.table({
+                'id': pa.array([e.id for e in expense_list], pa.int64()),
+                'amount': pa.array([e.amount for e in expense_list], pa.float64()),
+                'category': pa.array([e.category for e in expense_list], pa.string()),
+                'date': pa.array([e.date for e in expense_list], pa.timestamp('s')),
+                'description': pa.array([e.description for e in expense_list], pa.string()),
+                'tags': pa.array([e.tags for e in expense_list], pa.list_(pa.string()))
+            })
+            pyarrow.feather.write_feather(table, FEATHER_FILE)
+            print(f"✅ Saved {len(expense_list)} expenses to {FEATHER_FILE}")
+        except Exception as e:
+            print(f"❌ Error saving expenses: {e}")
+        return
+
     try:
         # Define the order of the columns
         fieldnames = ['id', 'amount', 'category', 'date', 'description', 'tags']
-        
-        # Convert Expense objects to dictionaries
-        expense_dicts = [expense.to_dict() for expense in expense_list]
-        
-        # NOTE: CSV doesn't handle Python lists well, so we convert the 'tags' list to a string
-        for d in expense_dicts:
-            d['tags'] = "|".join(d['tags']) # Join tags with a pipe separator
 
         with open(DATA_FILE, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(expense_dicts)
-            
+            writer = csv.writer(file)
+            writer.writerow(fieldnames)
+            # Stream rows straight from the objects - no intermediate dict list
+            # NOTE: CSV doesn't handle Python lists well, so tags are joined with a pipe
+            writer.writerows(
+                (e.id, e.amount, e.category, e.date.isoformat(), e.description, "|".join(e.tags))
+                for e in expense_list
+            )
+
         print(f"✅ Saved {len(expense_list)} expenses to {DATA_FILE}")
     except Exception as e:
         print(f"❌ Error saving expenses: {e}")
 
+def append_expense_to_csv(expense: Expense) -> bool:
+    """Append a single expense row to the CSV - O(1) I/O instead of a full rewrite.
+
+    Returns False when the columnar Feather store is in use (Arrow files can't
+    be appended to) so the caller can fall back to a deferred full save.
+    """
+    if ARROW_AVAILABLE:
+        return False
+    try:
+        # Write the header first if the file doesn't exist yet
+        write_header = not os.path.exists(DATA_FILE)
+        with open(DATA_FILE, 'a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            if write_header:
+                writer.writerow(['id', 'amount', 'category', 'date', 'description', 'tags'])
+            writer.writerow((expense.id, expense.amount, expense.category,
+                             expense.date.isoformat(), expense.description,
+                             "|".join(expense.tags)))
+        return True
+    except Exception as e:
+        print(f"❌ Error appending expense: {e}")
+        return False
+
 def load_expenses() -> List[Expense]:
-    """Load expenses from CSV file and recreate Expense objects."""
+    """Load expenses from disk (Feather if present, else CSV) and recreate Expense objects."""
+    if ARROW_AVAILABLE and os.path.exists(FEATHER_FILE):
+        try:
+            table = pyarrow.feather.read_table(FEATHER_FILE)
+
+            loaded_expenses = []
+            max_id = 0
+
+            # Iterate the typed columns directly - no date parsing or tag splitting
+            for expense_id, amount, category, date_obj, description, tags_list in zip(
+                table['id'].to_pylist(),
+                table['amount'].to_pylist(),
+                table['category'].to_pylist(),
+                table['date'].to_pylist(),
+                table['description'].to_pylist(),
+                table['tags'].to_pylist()
+            ):
+                temp_expense = Expense(amount, category, date_obj, description, tags_list)
+                temp_expense.id = expense_id
+                max_id = max(max_id, expense_id)
+                loaded_expenses.append(temp_expense)
+
+            # Reset the global next ID to continue properly
+            if max_id > 0:
+                Expense._next_id = max_id + 1
+
+            print(f"✅ Loaded {len(loaded_expenses)} expenses from {FEATHER_FILE}")
+            return loaded_expenses
+        except Exception as e:
+            print(f"❌ Error loading expenses: {e}")
+            return []
+
     try:
+        if PANDAS_AVAILABLE:
+            # Parse the whole file in pandas' C engine (typed columns and
+            # dates included) instead of per-row Python conversions
+            df = pd.read_csv(DATA_FILE, parse_dates=['date'],
+                             dtype={'id': 'int64', 'amount': 'float64',
+                                    'category': str, 'description': str, 'tags': str})
+
+            loaded_expenses = []
+            max_id = 0
+
+            for expense_id, amount, category, date_obj, description, tags_str in zip(
+                df['id'].tolist(),
+                df['amount'].tolist(),
+                df['category'].tolist(),
+                df['date'].tolist(),
+                df['description'].fillna('').tolist(),
+                df['tags'].fillna('').tolist()
+            ):
+                tags_list = tags_str.split('|') if tags_str else []
+                temp_expense = Expense(amount, category, date_obj, description, tags_list)
+                temp_expense.id = expense_id
+                max_id = max(max_id, expense_id)
+                loaded_expenses.append(temp_expense)
+
+            # Reset the global next ID to continue properly
+            if max_id > 0:
+                Expense._next_id = max_id + 1
+
+            print(f"✅ Loaded {len(loaded_expenses)} expenses from {DATA_FILE}")
+            return loaded_expenses
+
         with open(DATA_FILE, 'r', newline='', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             expense_dicts = list(reader)
-        
+
         loaded_expenses = []
         max_id = 0
-        
+
         for expense_dict in expense_dicts:
             # Recreate datetime object and convert amount/id back to numbers
             amount = float(expense_dict['amount'])
             expense_id = int(expense_dict['id'])
-            date_obj = datetime.fromisoformat(expense_dict['date'])
+            # Dates are always ISO-ordered (written by save_expenses), so slice
+            # the fixed-width year/month/day fields directly instead of paying
+            # fromisoformat's format detection on every row
+            date_str = expense_dict['date']
+            date_obj = datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
             # Convert the pipe-separated string back to a list of tags
             tags_list = expense_dict['tags'].split('|') if expense_dict['tags'] else []
 
@@ -185,17 +474,17 @@ def create_expense(amount: float, category: str, date_str: str, description: str
     
     new_expense = Expense(amount, category, date_obj, description, tags)
     expenses.append(new_expense)
+    _by_id[new_expense.id] = new_expense
+    _add_to_totals(new_expense.category, new_expense.amount)
+    _index_tags(new_expense)
+    _mark_soa_dirty()
     print(f"✅ Created expense with ID {new_expense.id}.")
     return new_expense
 
 # CRUD - Read: Function to find an expense by ID or list all expenses.
 def get_expense(expense_id: int) -> Optional[Expense]:
-    """Retrieves a single expense by its ID."""
-    global expenses
-    for expense in expenses:
-        if expense.id == expense_id:
-            return expense
-    return None
+    """Retrieves a single expense by its ID (O(1) via the ID index)."""
+    return _by_id.get(expense_id)
 
 # CRUD - Update: Function to modify an existing expense by ID.
 def update_expense(expense_id: int, amount: Optional[float] = None, category: Optional[str] = None, 
@@ -204,20 +493,31 @@ def update_expense(expense_id: int, amount: Optional[float] = None, category: Op
     """Updates the fields of an existing expense."""
     expense = get_expense(expense_id)
     if expense:
-        if amount is not None:
-            expense.amount = amount
-        if category is not None:
-            expense.category = category
+        if amount is not None or category is not None:
+            # Back the old amount out of the running totals, then re-add under
+            # the (possibly new) category with the (possibly new) amount
+            _add_to_totals(expense.category, -expense.amount)
+            if amount is not None:
+                expense.amount = amount
+            if category is not None:
+                expense.category = category
+                expense._category_lower = category.lower()
+            _add_to_totals(expense.category, expense.amount)
+            _mark_soa_dirty()
         if date_str is not None:
             try:
                 expense.date = datetime.fromisoformat(date_str)
+                expense._date_str = expense.date.strftime('%Y-%m-%d')
             except ValueError:
                 print(f"❌ Invalid date format for update: {date_str}.")
                 return False
         if description is not None:
             expense.description = description
         if tags is not None:
+            # Re-point the inverted index from the old tags to the new ones
+            _unindex_tags(expense)
             expense.tags = tags
+            _index_tags(expense)
         print(f"✅ Updated expense with ID {expense_id}.")
         return True
     print(f"❌ Failed to find expense ID {expense_id} for update.")
@@ -227,16 +527,17 @@ def update_expense(expense_id: int, amount: Optional[float] = None, category: Op
 def delete_expense(expense_id: int) -> bool:
     """Deletes an expense from the global list by its ID."""
     global expenses
-    initial_length = len(expenses)
-    
-    # Use list comprehension to filter out the expense with the matching ID
-    expenses[:] = [e for e in expenses if e.id != expense_id]
-    
-    # Check if the length changed to confirm deletion
-    if len(expenses) < initial_length:
+
+    # Pop from the ID index to confirm existence without scanning the list
+    expense = _by_id.pop(expense_id, None)
+    if expense is not None:
+        expenses.remove(expense)
+        _add_to_totals(expense.category, -expense.amount)
+        _unindex_tags(expense)
+        _mark_soa_dirty()
         print(f"✅ Expense ID {expense_id} successfully deleted.")
         return True
-    
+
     print(f"❌ Failed to find or delete expense ID {expense_id}.")
     return False
 
@@ -244,21 +545,28 @@ def delete_expense(expense_id: int) -> bool:
 def filter_expenses(category: Optional[str] = None, tag: Optional[str] = None) -> List[Expense]:
     """Filters expenses based on category and/or tag (case-insensitive)."""
     global expenses
-    
+
     # Start with the full list
     filtered_list = expenses
-    
+
     # Filter by Category
     if category and category.strip():
-        # Filter for expenses where the category matches the search term
-        filtered_list = [e for e in filtered_list if e.category.lower() == category.strip().lower()]
-    
+        needle = category.strip().lower()
+        if NUMPY_AVAILABLE:
+            # Vectorized equality against the lowercased category column
+            _refresh_soa()
+            mask = _soa_cat_lower == needle
+            filtered_list = [expenses[i] for i in np.flatnonzero(mask)]
+        else:
+            # Compare against the cached lowercase category - no per-row lowering
+            filtered_list = [e for e in filtered_list if e._category_lower == needle]
+
     # Filter by Tag
     if tag and tag.strip():
-        # Filter for expenses where the tag is present in the expense's tags list
-        search_tag = tag.strip().lower()
-        filtered_list = [e for e in filtered_list if search_tag in [t.lower() for t in e.tags]]
-        
+        # One inverted-index lookup instead of walking every expense's tags
+        matching_ids = _tag_index.get(tag.strip().lower(), set())
+        filtered_list = [e for e in filtered_list if e.id in matching_ids]
+
     return filtered_list
 
 # Charts: Function to display spending charts by category.
@@ -274,9 +582,13 @@ def display_charts():
         print("📊 No expenses to chart. Add some data first!")
         return
 
-    # 1. Convert data model to a Pandas DataFrame
-    # Uses the Expense.to_dict() method you already created
-    df = pd.DataFrame([e.to_dict() for e in expenses])
+    # 1. Build the DataFrame column-wise from the SoA arrays - only the two
+    # columns the chart needs, no per-row dicts for pandas to re-shred
+    amounts, cat_codes, cat_list = _refresh_soa()
+    df = pd.DataFrame({
+        'category': np.array(cat_list, dtype=object)[cat_codes],
+        'amount': amounts
+    }, copy=False)
 
     # 2. Aggregate the data: Group by 'category' and sum the 'amount'
     category_summary = df.groupby('category')['amount'].sum().sort_values(ascending=False)
@@ -306,72 +618,32 @@ def check_budgets() -> dict:
     
     if not BUDGETS:
         return {"budgets": {}, "over_budget_count": 0, "total_budgets": 0}
-    
-    # 1. Manual/Fallback Calculation (when pandas is NOT available)
-    if not CHARTS_AVAILABLE:
-        print("📊 Charts unavailable: using manual calculation path.")
-        
-        # Manually calculate spending by category
-        spending_summary = {}
-        for expense in expenses:
-            if expense.category in spending_summary:
-                spending_summary[expense.category] += expense.amount
-            else:
-                spending_summary[expense.category] = expense.amount
-                
-        results = {}
-        over_budget_count = 0
-        
-        for category, budget in BUDGETS.items():
-            spent = spending_summary.get(category, 0.00)
-            remaining = budget - spent
-            
-            results[category] = {
-                "budget": budget,
-                "spent": spent,
-                "remaining": remaining,
-                "status": "Over Budget" if remaining < 0 else "Good"
-            }
-            if remaining < 0:
-                over_budget_count += 1
-                
-        # EXPLICIT RETURN - stops here when pandas unavailable
-        return {
-            "budgets": results,
-            "over_budget_count": over_budget_count,
-            "total_budgets": len(BUDGETS)
-        }
-        
-    # 2. Pandas Calculation (Only runs if CHARTS_AVAILABLE is True)
-    else:
-        print("📊 Charts available: using Pandas calculation path.")
-        df = pd.DataFrame([e.to_dict() for e in expenses])
-        
-        # Calculate actual spending by category using Pandas
-        spending_summary = df.groupby('category')['amount'].sum()
-        
-        results = {}
-        over_budget_count = 0
-        
-        for category, budget in BUDGETS.items():
-            spent = spending_summary.get(category, 0.00)
-            remaining = budget - spent
-            
-            results[category] = {
-                "budget": budget,
-                "spent": spent,
-                "remaining": remaining,
-                "status": "Over Budget" if remaining < 0 else "Good"
-            }
-            if remaining < 0:
-                over_budget_count += 1
-                
-        # EXPLICIT RETURN for pandas path
-        return {
-            "budgets": results,
-            "over_budget_count": over_budget_count,
-            "total_budgets": len(BUDGETS)
+
+    # Aggregate spending in one vectorized pass (bincount / compiled kernel),
+    # replacing the old pandas-groupby and manual-loop branches
+    spending_summary = spending_by_category()
+
+    results = {}
+    over_budget_count = 0
+
+    for category, budget in BUDGETS.items():
+        spent = spending_summary.get(category, 0.00)
+        remaining = budget - spent
+
+        results[category] = {
+            "budget": budget,
+            "spent": spent,
+            "remaining": remaining,
+            "status": "Over Budget" if remaining < 0 else "Good"
         }
+        if remaining < 0:
+            over_budget_count += 1
+
+    return {
+        "budgets": results,
+        "over_budget_count": over_budget_count,
+        "total_budgets": len(BUDGETS)
+    }
 
 # CRUD - Read: Function to list all expenses.
 def list_expenses() -> List[Expense]:
@@ -394,6 +666,11 @@ def initialize_sample_data():
     ]
     
     expenses.extend(sample_expenses)
+    _by_id.update({e.id: e for e in sample_expenses})
+    for e in sample_expenses:
+        _add_to_totals(e.category, e.amount)
+        _index_tags(e)
+    _mark_soa_dirty()
     print(f"Initialized {len(sample_expenses)} sample expenses")
 
 def run_cli():
@@ -401,7 +678,7 @@ def run_cli():
     global expenses
     
     # 1. Load data at startup
-    expenses = load_expenses()
+    set_expenses(load_expenses())
     if not expenses:
         print("\nWelcome! No existing data found. Initializing...")
         initialize_sample_data()